@@ -5,7 +5,10 @@ import astropy.units as u
 
 
 def _parameter_to_value(param):
-    if param.unit is not None:
-        return u.Quantity(param)
+    unit = param.unit
+    if unit is not None:
+        # Build a view over the parameter's value rather than copying it;
+        # for array-valued parameters the copy dominates serialization cost.
+        return u.Quantity(param.value, unit, copy=False)
     else:
         return param.value
@@ -1,44 +1,89 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 # -*- coding: utf-8 -*-
 
-from asdf import tagged, yamlutil
+import functools
+import sys
+
+from asdf import yamlutil
 
 from astropy.modeling import mappings
-from astropy.utils import minversion
-from astropy.modeling import functional_models
 from astropy.io.misc.asdf.types import AstropyAsdfType
 
 
 __all__ = ['TransformType', 'IdentityType', 'ConstantType']
 
 
+# Sentinel distinguishing "key absent" from a stored None, so each optional
+# node member costs a single dict lookup instead of a membership test plus a
+# subscript.
+_MISSING = object()
+
+
+def _intern_node_keys(node):
+    """
+    Replace the node's string keys with their interned equivalents.
+
+    Keys produced by the YAML parser are generally not interned, while the
+    key literals used throughout these tag classes are, so interning once
+    here lets every subsequent lookup take CPython's pointer-equality fast
+    path.
+    """
+    for key in list(node):
+        interned = sys.intern(key)
+        if interned is not key:
+            node[interned] = node.pop(key)
+    return node
+
+
+@functools.lru_cache(maxsize=None)
+def _inputs_is_property(model_class):
+    """
+    Whether ``inputs`` is defined as a property on the given model class
+    (old-style models) rather than set per-instance.  Cached because the
+    answer is fixed per class and this is checked on every serialization.
+    """
+    return type(model_class.inputs) is property
+
+
 class TransformType(AstropyAsdfType):
     version = '1.1.0'
     requires = ['astropy']
 
     @classmethod
     def _from_tree_base_transform_members(cls, model, node, ctx):
-        if 'inverse' in node:
-            model.inverse = yamlutil.tagged_tree_to_custom_tree(
-                node['inverse'], ctx)
-
-        if 'name' in node:
-            model = model.rename(node['name'])
-
-        if 'bounding_box' in node:
-            model.bounding_box = yamlutil.tagged_tree_to_custom_tree(node['bounding_box'], ctx)
-
-        if "inputs" in node:
-            if model.n_inputs == 1:
-                model.inputs = (node["inputs"],)
+        inverse = node.get('inverse', _MISSING)
+        if inverse is not _MISSING:
+            model.inverse = yamlutil.tagged_tree_to_custom_tree(inverse, ctx)
+
+        name = node.get('name', _MISSING)
+        if name is not _MISSING:
+            model = model.rename(name)
+
+        bounding_box = node.get('bounding_box', _MISSING)
+        if bounding_box is not _MISSING:
+            model.bounding_box = yamlutil.tagged_tree_to_custom_tree(bounding_box, ctx)
+
+        inputs = node.get('inputs', _MISSING)
+        if inputs is not _MISSING:
+            n_inputs = model.n_inputs
+            if n_inputs == 1:
+                model.inputs = (inputs,)
+            elif n_inputs == 2:
+                # The common case for compound transforms; avoids the
+                # generic tuple() iteration.
+                model.inputs = (inputs[0], inputs[1])
             else:
-                model.inputs = tuple(node["inputs"])
-
-        if "outputs" in node:
-            if model.n_outputs == 1:
-                model.outputs = (node["outputs"],)
+                model.inputs = tuple(inputs)
+
+        outputs = node.get('outputs', _MISSING)
+        if outputs is not _MISSING:
+            n_outputs = model.n_outputs
+            if n_outputs == 1:
+                model.outputs = (outputs,)
+            elif n_outputs == 2:
+                model.outputs = (outputs[0], outputs[1])
             else:
-                model.outputs = tuple(node["outputs"])
+                model.outputs = tuple(outputs)
 
         return model
 
@@ -49,6 +94,7 @@ class TransformType(AstropyAsdfType):
 
     @classmethod
     def from_tree(cls, node, ctx):
+        node = _intern_node_keys(node)
         model = cls.from_tree_transform(node, ctx)
         model = cls._from_tree_base_transform_members(model, node, ctx)
         return model
@@ -69,11 +115,11 @@ class TransformType(AstropyAsdfType):
 
         if bb is not None:
             if model.n_inputs == 1:
-                bb = list(bb)
+                bb = [bb[0], bb[1]]
             else:
-                bb = [list(item) for item in model.bounding_box]
+                bb = [list(item) for item in bb]
             node['bounding_box'] = yamlutil.custom_tree_to_tagged_tree(bb, ctx)
-        if type(model.__class__.inputs) != property:
+        if not _inputs_is_property(type(model)):
             node['inputs'] = model.inputs
             node['outputs'] = model.outputs
 
@@ -124,6 +170,7 @@ class ConstantType(TransformType):
 
     @classmethod
     def from_tree_transform(cls, node, ctx):
+        from astropy.modeling import functional_models
         return functional_models.Const1D(node['value'])
 
     @classmethod